@@ -0,0 +1,243 @@
+"""
+Admission Control Module for SeAI
+Rate limits clients and fairly schedules CPU-heavy image requests
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Dict
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is not admitted"""
+
+    def __init__(self, message: str, status: int = 429, retry_after: int = 1):
+        """
+        Initialize rejection
+
+        Args:
+            message: Reason for rejection
+            status: HTTP status code to return
+            retry_after: Seconds the client should wait before retrying
+        """
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed rate"""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize a full bucket
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def consume(self, cost: float) -> float:
+        """
+        Take tokens from the bucket if enough are available
+
+        Args:
+            cost: Tokens required (clamped to the bucket capacity)
+
+        Returns:
+            0 if consumed, otherwise seconds until enough tokens are available
+        """
+        self._refill()
+        cost = min(cost, self.capacity)
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return 0.0
+        return (cost - self.tokens) / self.rate
+
+    def is_full(self) -> bool:
+        self._refill()
+        return self.tokens >= self.capacity
+
+
+class _Ticket:
+    """A queued request waiting for a worker slot"""
+
+    def __init__(self, client_id: str, start: float, finish: float):
+        self.client_id = client_id
+        self.start = start
+        self.finish = finish
+
+
+class AdmissionController:
+    """
+    Per-client token-bucket rate limiting with weighted fair queueing
+
+    Each request is charged its cost (megapixels) against its client's token
+    bucket, then queued until one of max_workers slots is free. Queued
+    requests are served in order of virtual finish time. Each (client,
+    priority) pair is its own flow with its own queue-depth budget, so a
+    client with a long backlog cannot starve others, and higher-weight
+    priorities (verify) skip ahead of lower-weight ones (embed), including
+    the same client's own backlog.
+    """
+
+    MAX_TRACKED_CLIENTS = 10000
+
+    def __init__(self, max_workers: int, rate: float, burst: float,
+                 max_queue_depth: int, queue_timeout: float, weights: Dict[str, float]):
+        """
+        Initialize admission controller
+
+        Args:
+            max_workers: Requests allowed to run at the same time
+            rate: Cost units refilled per second for each client
+            burst: Token bucket capacity for each client
+            max_queue_depth: Queued requests allowed per client and priority
+            queue_timeout: Seconds a request may wait for a worker slot
+            weights: Scheduling weight for each priority class
+        """
+        self.max_workers = max_workers
+        self.rate = rate
+        self.burst = burst
+        self.max_queue_depth = max_queue_depth
+        self.queue_timeout = queue_timeout
+        self.weights = weights
+
+        self.cond = threading.Condition()
+        self.buckets = {}
+        self.last_finish = {}
+        self.flow_queued = {}
+        self.stats = {}
+        self.waiting = []
+        self.sequence = itertools.count()
+        self.virtual_time = 0.0
+        self.active = 0
+        self.prune_threshold = self.MAX_TRACKED_CLIENTS
+
+    def _client_stats(self, client_id: str) -> dict:
+        if client_id not in self.stats:
+            self.stats[client_id] = {'queued': 0, 'active': 0, 'admitted': 0, 'rejected': 0}
+        return self.stats[client_id]
+
+    def _add_queued(self, flow: tuple, delta: int):
+        queued = self.flow_queued.get(flow, 0) + delta
+        if queued:
+            self.flow_queued[flow] = queued
+        else:
+            self.flow_queued.pop(flow, None)
+
+    def _prune(self):
+        """
+        Forget idle clients once too many are tracked
+
+        The threshold doubles with the surviving client count, so the full
+        scan runs rarely and its cost is amortized across requests.
+        """
+        if len(self.buckets) <= self.prune_threshold:
+            return
+        for client_id in list(self.buckets):
+            stats = self.stats.get(client_id, {})
+            if self.buckets[client_id].is_full() and not stats.get('queued') and not stats.get('active'):
+                del self.buckets[client_id]
+                for priority in self.weights:
+                    self.last_finish.pop((client_id, priority), None)
+                self.stats.pop(client_id, None)
+        self.prune_threshold = max(self.MAX_TRACKED_CLIENTS, 2 * len(self.buckets))
+
+    def acquire(self, client_id: str, cost: float, priority: str) -> _Ticket:
+        """
+        Admit a request and block until it may run
+
+        Args:
+            client_id: Caller identity (API key or IP)
+            cost: Request cost in megapixels
+            priority: Priority class, a key of weights
+
+        Returns:
+            Ticket to pass to release()
+
+        Raises:
+            AdmissionRejected: If rate limited, queue is full or the wait times out
+        """
+        with self.cond:
+            self._prune()
+            stats = self._client_stats(client_id)
+            flow = (client_id, priority)
+
+            if self.flow_queued.get(flow, 0) >= self.max_queue_depth:
+                stats['rejected'] += 1
+                raise AdmissionRejected('Too many queued requests')
+
+            bucket = self.buckets.setdefault(client_id, TokenBucket(self.rate, self.burst))
+            wait = bucket.consume(cost)
+            if wait:
+                stats['rejected'] += 1
+                raise AdmissionRejected('Rate limit exceeded', retry_after=int(wait) + 1)
+
+            start = max(self.virtual_time, self.last_finish.get(flow, 0.0))
+            ticket = _Ticket(client_id, start, start + cost / self.weights[priority])
+            self.last_finish[flow] = ticket.finish
+            heapq.heappush(self.waiting, (ticket.finish, next(self.sequence), ticket))
+            self._add_queued(flow, 1)
+            stats['queued'] += 1
+
+            deadline = time.monotonic() + self.queue_timeout
+            while self.active >= self.max_workers or self.waiting[0][2] is not ticket:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.waiting = [entry for entry in self.waiting if entry[2] is not ticket]
+                    heapq.heapify(self.waiting)
+                    self._add_queued(flow, -1)
+                    stats['queued'] -= 1
+                    stats['rejected'] += 1
+                    self.cond.notify_all()
+                    raise AdmissionRejected('Server busy, request timed out in queue', status=503)
+                self.cond.wait(remaining)
+
+            heapq.heappop(self.waiting)
+            self.virtual_time = max(self.virtual_time, ticket.start)
+            self.active += 1
+            self._add_queued(flow, -1)
+            stats['queued'] -= 1
+            stats['active'] += 1
+            stats['admitted'] += 1
+            self.cond.notify_all()
+            return ticket
+
+    def release(self, ticket: _Ticket):
+        """
+        Free the worker slot held by a finished request
+
+        Args:
+            ticket: Ticket returned by acquire()
+        """
+        with self.cond:
+            self.active -= 1
+            self._client_stats(ticket.client_id)['active'] -= 1
+            self.cond.notify_all()
+
+    def snapshot(self) -> dict:
+        """
+        Report scheduler load and per-client counters
+
+        Returns:
+            Dictionary of global and per-client statistics
+        """
+        with self.cond:
+            return {
+                'max_workers': self.max_workers,
+                'active': self.active,
+                'queued': len(self.waiting),
+                'clients': {client_id: dict(stats) for client_id, stats in self.stats.items()}
+            }
@@ -4,13 +4,21 @@ Provides REST API for image encryption and verification
 """
 
 from flask import Flask, request, jsonify, send_file
+from functools import wraps
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
 import os
 from dotenv import load_dotenv
 from encryption import SeAlEncryption
+from signing import SeAlSigner
 from steganography import ImageSteganography
+from jpeg_steganography import JpegSteganography
+from ledger import SealLedger
+from admission import AdmissionController, AdmissionRejected
+from PIL import Image
 import uuid
+import hmac
+import hashlib
 from datetime import datetime
 
 # Load environment variables
@@ -22,7 +30,8 @@ CORS(app)
 # Configuration
 UPLOAD_FOLDER = 'uploads'
 OUTPUT_FOLDER = 'output'
-ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'bmp'}
+ALLOWED_EXTENSIONS = {'png', 'apng', 'jpg', 'jpeg', 'bmp', 'gif', 'webp', 'tif', 'tiff'}
+JPEG_EXTENSIONS = {'jpg', 'jpeg'}
 MAX_FILE_SIZE = 16 * 1024 * 1024  # 16MB
 
 # Ensure directories exist
@@ -33,10 +42,123 @@ app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['OUTPUT_FOLDER'] = OUTPUT_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
 
-# Initialize encryption with master key from environment
-MASTER_KEY = os.getenv('SEAL_MASTER_KEY', 'default-master-key-change-in-production')
-encryption_handler = SeAlEncryption(MASTER_KEY)
-stego_handler = ImageSteganography()
+# Initialize encryption with master key from environment; nodes without
+# SEAL_MASTER_KEY neither issue nor accept AES tags
+MASTER_KEY = os.getenv('SEAL_MASTER_KEY')
+encryption_handler = SeAlEncryption(MASTER_KEY) if MASTER_KEY else None
+
+# Tag mode: 'aes' (symmetric master key) or 'ed25519' (signed, public-key verification)
+TAG_MODES = {'aes', 'ed25519'}
+TAG_MODE = os.getenv('SEAL_TAG_MODE', 'aes').lower()
+if TAG_MODE not in TAG_MODES:
+    raise ValueError(f"Invalid SEAL_TAG_MODE: {TAG_MODE}. Allowed: aes, ed25519")
+SIGNING_KEY = os.getenv('SEAL_SIGNING_KEY')
+VERIFY_KEY = os.getenv('SEAL_VERIFY_KEY')
+signing_handler = SeAlSigner(SIGNING_KEY, VERIFY_KEY) if (SIGNING_KEY or VERIFY_KEY) else None
+if TAG_MODE == 'ed25519' and signing_handler is None:
+    raise ValueError("SEAL_TAG_MODE=ed25519 requires SEAL_SIGNING_KEY or SEAL_VERIFY_KEY")
+
+# Handler issuing new tags; None on verify-only nodes, which disables embedding
+if TAG_MODE == 'ed25519':
+    seal_issuer = signing_handler if signing_handler.signing_key is not None else None
+else:
+    seal_issuer = encryption_handler
+
+# Issued seal ledger and revocation store
+LEDGER_PATH = os.getenv('SEAL_LEDGER_PATH', 'seal_ledger.db')
+REVOCATION_CAPACITY = int(os.getenv('SEAL_REVOCATION_CAPACITY', '1000000'))
+ADMIN_TOKEN = os.getenv('SEAL_ADMIN_TOKEN')
+ledger = SealLedger(LEDGER_PATH, REVOCATION_CAPACITY)
+
+# Frames tagged in animations and multi-page TIFFs: 'first', 'all' or 'nth'
+FRAME_POLICY = os.getenv('SEAL_FRAME_POLICY', 'first').lower()
+FRAME_STEP = int(os.getenv('SEAL_FRAME_STEP', '1'))
+
+stego_handler = ImageSteganography(FRAME_POLICY, FRAME_STEP)
+jpeg_stego_handler = JpegSteganography(FRAME_POLICY, FRAME_STEP)
+
+# Admission control: per-client token buckets charged in megapixels, and
+# weighted fair queueing of CPU-heavy requests onto a fixed worker pool
+admission_controller = AdmissionController(
+    max_workers=int(os.getenv('SEAL_MAX_WORKERS', str(os.cpu_count() or 1))),
+    rate=float(os.getenv('SEAL_RATE_MPX_PER_SEC', '4')),
+    burst=float(os.getenv('SEAL_RATE_BURST_MPX', '64')),
+    max_queue_depth=int(os.getenv('SEAL_MAX_QUEUE_DEPTH', '8')),
+    queue_timeout=float(os.getenv('SEAL_QUEUE_TIMEOUT', '30')),
+    weights={
+        'verify': float(os.getenv('SEAL_VERIFY_WEIGHT', '4')),
+        'embed': float(os.getenv('SEAL_EMBED_WEIGHT', '1'))
+    }
+)
+MIN_REQUEST_COST = 0.1  # Megapixels charged for tiny or unreadable images
+
+# Only allow-listed API keys get their own admission flow; unknown keys are
+# ignored so callers cannot mint fresh buckets by rotating keys
+API_KEY_HASHES = {
+    hashlib.sha256(key.strip().encode('utf-8')).hexdigest()
+    for key in os.getenv('SEAL_API_KEYS', '').split(',') if key.strip()
+}
+
+
+def get_client_id():
+    """Identify the caller by allow-listed API key, falling back to remote IP"""
+    api_key = request.headers.get('X-API-Key')
+    if api_key:
+        key_hash = hashlib.sha256(api_key.encode('utf-8')).hexdigest()
+        if key_hash in API_KEY_HASHES:
+            return 'key:' + key_hash[:16]
+    return f'ip:{request.remote_addr}'
+
+
+def get_request_cost():
+    """Estimate request cost in megapixels from the uploaded image header"""
+    file = request.files.get('image')
+    if file is None:
+        return MIN_REQUEST_COST
+    try:
+        with Image.open(file.stream) as img:
+            pixels = img.width * img.height * getattr(img, 'n_frames', 1)
+        return max(MIN_REQUEST_COST, pixels / 1_000_000)
+    except Exception:
+        return MIN_REQUEST_COST
+    finally:
+        file.stream.seek(0)
+
+
+def admission_required(priority):
+    """Run a view only once admitted by the admission controller"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            try:
+                ticket = admission_controller.acquire(get_client_id(), get_request_cost(), priority)
+            except AdmissionRejected as e:
+                response = jsonify({'error': str(e)})
+                response.headers['Retry-After'] = str(e.retry_after)
+                return response, e.status
+            try:
+                return view(*args, **kwargs)
+            finally:
+                admission_controller.release(ticket)
+        return wrapper
+    return decorator
+
+
+def is_admin_request():
+    """Check the admin token header against SEAL_ADMIN_TOKEN"""
+    return bool(ADMIN_TOKEN) and hmac.compare_digest(request.headers.get('X-Admin-Token', ''), ADMIN_TOKEN)
+
+
+def read_seal_metadata(extracted_tag):
+    """Verify an extracted tag and return its metadata; signed tags only need the public key"""
+    if SeAlSigner.is_signed_tag(extracted_tag):
+        if signing_handler is None:
+            raise ValueError("Verify key not configured")
+        return signing_handler.get_seal_metadata(extracted_tag)
+
+    if encryption_handler is None:
+        raise ValueError("Master key not configured")
+    return encryption_handler.get_seal_metadata(extracted_tag)
 
 
 def allowed_file(filename):
@@ -55,6 +177,7 @@ def health_check():
 
 
 @app.route('/api/embed', methods=['POST'])
+@admission_required('embed')
 def embed_seal():
     """
     Embed SeAl tag into an uploaded image
@@ -66,6 +189,9 @@ def embed_seal():
         JSON with success status and download URL
     """
     try:
+        if seal_issuer is None:
+            return jsonify({'error': 'Sealing is disabled on this verify-only node'}), 503
+
         # Check if image file is present
         if 'image' not in request.files:
             return jsonify({'error': 'No image file provided'}), 400
@@ -76,36 +202,51 @@ def embed_seal():
             return jsonify({'error': 'No file selected'}), 400
 
         if not allowed_file(file.filename):
-            return jsonify({'error': 'Invalid file type. Allowed: PNG, JPG, JPEG, BMP'}), 400
+            return jsonify({'error': 'Invalid file type. Allowed: PNG, APNG, JPG, JPEG, BMP, GIF, WEBP, TIFF'}), 400
 
         # Generate unique filename
         original_filename = secure_filename(file.filename)
         file_ext = original_filename.rsplit('.', 1)[1].lower()
         unique_id = str(uuid.uuid4())
         upload_filename = f"{unique_id}_upload.{file_ext}"
-        output_filename = f"{unique_id}_sealed.png"
+
+        # Public tag ID, kept separate from the download filename
+        tag_id = str(uuid.uuid4())
 
         upload_path = os.path.join(app.config['UPLOAD_FOLDER'], upload_filename)
-        output_path = os.path.join(app.config['OUTPUT_FOLDER'], output_filename)
 
         # Save uploaded file
         file.save(upload_path)
 
-        # Check image capacity
-        capacity = stego_handler.calculate_capacity(upload_path)
-        if capacity < 100:
-            os.remove(upload_path)
-            return jsonify({'error': 'Image too small for embedding SeAl tag'}), 400
-
         # Generate encrypted SeAl tag
         metadata = {
             'timestamp': datetime.utcnow().isoformat(),
-            'original_filename': original_filename
+            'original_filename': original_filename,
+            'tag_id': tag_id
         }
-        encrypted_tag = encryption_handler.generate_seal_tag(str(metadata))
+        encrypted_tag = seal_issuer.generate_seal_tag(str(metadata))
 
-        # Embed tag in image
-        success = stego_handler.embed_tag(upload_path, encrypted_tag, output_path)
+        # Embed baseline JPEGs in the DCT domain so the output stays a JPEG
+        success = False
+        if file_ext in JPEG_EXTENSIONS:
+            output_filename = f"{unique_id}_sealed.jpg"
+            output_path = os.path.join(app.config['OUTPUT_FOLDER'], output_filename)
+            success = jpeg_stego_handler.embed_tag(upload_path, encrypted_tag, output_path)
+
+        # Fall back to pixel LSB embedding; PNG output, or a lossless
+        # multi-frame format for animations and multi-page TIFFs
+        if not success:
+            output_ext = stego_handler.get_output_format(upload_path).lower()
+            output_filename = f"{unique_id}_sealed.{output_ext}"
+            output_path = os.path.join(app.config['OUTPUT_FOLDER'], output_filename)
+
+            # Check image capacity
+            capacity = stego_handler.calculate_capacity(upload_path)
+            if capacity < 100:
+                os.remove(upload_path)
+                return jsonify({'error': 'Image too small for embedding SeAl tag'}), 400
+
+            success = stego_handler.embed_tag(upload_path, encrypted_tag, output_path)
 
         if not success:
             os.remove(upload_path)
@@ -114,9 +255,17 @@ def embed_seal():
         # Clean up upload file
         os.remove(upload_path)
 
+        # Record issuance in the ledger; never hand out an unrecorded seal
+        try:
+            ledger.record_issue(tag_id, original_filename, output_filename, metadata['timestamp'])
+        except Exception:
+            os.remove(output_path)
+            raise
+
         return jsonify({
             'success': True,
             'message': 'SeAl tag successfully embedded',
+            'tag_id': tag_id,
             'filename': output_filename,
             'download_url': f'/api/download/{output_filename}'
         }), 200
@@ -126,6 +275,7 @@ def embed_seal():
 
 
 @app.route('/api/verify', methods=['POST'])
+@admission_required('verify')
 def verify_seal():
     """
     Verify SeAl tag in an uploaded image
@@ -147,7 +297,7 @@ def verify_seal():
             return jsonify({'error': 'No file selected'}), 400
 
         if not allowed_file(file.filename):
-            return jsonify({'error': 'Invalid file type. Allowed: PNG, JPG, JPEG, BMP'}), 400
+            return jsonify({'error': 'Invalid file type. Allowed: PNG, APNG, JPG, JPEG, BMP, GIF, WEBP, TIFF'}), 400
 
         # Generate unique filename for verification
         original_filename = secure_filename(file.filename)
@@ -159,39 +309,120 @@ def verify_seal():
         # Save uploaded file
         file.save(verify_path)
 
-        # Extract tag from image
-        success, extracted_tag = stego_handler.extract_tag(verify_path)
+        # Extract candidate tags frame by frame and stop at the first one
+        # that verifies; the JPEG reader checks DCT coefficients and falls
+        # back to pixel LSB for other content, whatever the file name
+        tag_found = False
+        seal_metadata = None
+        for extracted_tag in jpeg_stego_handler.iter_tags(verify_path):
+            tag_found = True
+            try:
+                seal_metadata = read_seal_metadata(extracted_tag)
+                break
+            except ValueError:
+                continue
 
         # Clean up
         os.remove(verify_path)
 
-        if not success:
+        if not tag_found:
             return jsonify({
                 'verified': False,
                 'message': 'This image was not generated by AI.',
                 'details': 'No valid SeAl tag found in the image.'
             }), 200
 
-        # Verify the extracted tag
-        is_valid = encryption_handler.verify_seal_tag(extracted_tag)
-
-        if is_valid:
-            return jsonify({
-                'verified': True,
-                'message': 'SeAl tag verified!',
-                'details': 'This image contains a valid AI-generated SeAl tag.'
-            }), 200
-        else:
+        if seal_metadata is None:
             return jsonify({
                 'verified': False,
                 'message': 'This image was not generated by AI.',
                 'details': 'SeAl tag found but verification failed.'
             }), 200
 
+        # Check revocation; tags issued before the ledger carry no tag ID
+        tag_id = seal_metadata.get('tag_id')
+        if tag_id and ledger.is_revoked(tag_id):
+            return jsonify({
+                'verified': False,
+                'message': 'SeAl tag revoked.',
+                'details': 'This image contains a SeAl tag that has been revoked.',
+                'tag_id': tag_id
+            }), 200
+
+        return jsonify({
+            'verified': True,
+            'message': 'SeAl tag verified!',
+            'details': 'This image contains a valid AI-generated SeAl tag.',
+            'tag_id': tag_id
+        }), 200
+
     except Exception as e:
         return jsonify({'error': f'Server error: {str(e)}'}), 500
 
 
+@app.route('/api/revoke', methods=['POST'])
+def revoke_seal():
+    """
+    Revoke an issued SeAl tag
+
+    Expected headers:
+        - X-Admin-Token: Value of SEAL_ADMIN_TOKEN
+
+    Expected JSON body:
+        - tag_id: ID of the tag to revoke
+        - reason: Optional reason for revocation
+
+    Returns:
+        JSON with revocation result
+    """
+    try:
+        if not is_admin_request():
+            return jsonify({'error': 'Unauthorized'}), 403
+
+        data = request.get_json(silent=True) or {}
+        if not isinstance(data, dict):
+            return jsonify({'error': 'Expected a JSON object'}), 400
+
+        tag_id = data.get('tag_id')
+        if not tag_id:
+            return jsonify({'error': 'No tag_id provided'}), 400
+        if not isinstance(tag_id, str):
+            return jsonify({'error': 'tag_id must be a string'}), 400
+
+        reason = data.get('reason')
+        if reason is not None and not isinstance(reason, str):
+            return jsonify({'error': 'reason must be a string'}), 400
+
+        if not ledger.revoke(tag_id, reason):
+            return jsonify({'error': 'Unknown tag_id'}), 404
+
+        return jsonify({
+            'success': True,
+            'message': 'SeAl tag revoked',
+            'tag_id': tag_id
+        }), 200
+
+    except Exception as e:
+        return jsonify({'error': f'Server error: {str(e)}'}), 500
+
+
+@app.route('/api/admission', methods=['GET'])
+def admission_status():
+    """
+    Report admission control load, per-client queue depth and rejections
+
+    Expected headers:
+        - X-Admin-Token: Value of SEAL_ADMIN_TOKEN
+
+    Returns:
+        JSON with scheduler statistics
+    """
+    if not is_admin_request():
+        return jsonify({'error': 'Unauthorized'}), 403
+
+    return jsonify(admission_controller.snapshot()), 200
+
+
 @app.route('/api/download/<filename>', methods=['GET'])
 def download_file(filename):
     """
@@ -222,9 +453,10 @@ def get_info():
     return jsonify({
         'application': 'SeAI - AI Image Seal Verification System',
         'version': '1.0.0',
-        'encryption': 'AES-256-GCM',
-        'steganography': 'LSB (Least Significant Bit)',
+        'encryption': 'Ed25519 signature' if TAG_MODE == 'ed25519' else 'AES-256-GCM',
+        'steganography': 'LSB (Least Significant Bit), JPEG DCT coefficient LSB',
         'supported_formats': list(ALLOWED_EXTENSIONS),
+        'frame_policy': FRAME_POLICY,
         'max_file_size_mb': MAX_FILE_SIZE / (1024 * 1024)
     })
 
@@ -239,8 +471,8 @@ if __name__ == '__main__':
     print("=" * 60)
     print("SeAI Backend Server Starting...")
     print("=" * 60)
-    print(f"Encryption: AES-256-GCM")
-    print(f"Steganography: LSB Technique")
+    print(f"Encryption: {'Ed25519 signature' if TAG_MODE == 'ed25519' else 'AES-256-GCM'}")
+    print(f"Steganography: LSB Technique (DCT domain for JPEG)")
     print(f"Upload folder: {UPLOAD_FOLDER}")
     print(f"Output folder: {OUTPUT_FOLDER}")
     print("=" * 60)
@@ -9,6 +9,8 @@ from Crypto.Protocol.KDF import PBKDF2
 import base64
 import hashlib
 
+from seal_tag import parse_seal_metadata
+
 
 class SeAlEncryption:
     """Handle AES-256 encryption/decryption for SeAl tags"""
@@ -125,3 +127,18 @@ class SeAlEncryption:
             return decrypted.startswith("SeAl:AI-GENERATED")
         except:
             return False
+
+    def get_seal_metadata(self, encrypted_tag: str) -> dict:
+        """
+        Validate a SeAl tag and return the metadata it carries
+
+        Args:
+            encrypted_tag: Encrypted SeAl tag to read
+
+        Returns:
+            Metadata dictionary (empty if the tag carries none)
+
+        Raises:
+            ValueError: If the tag is not a valid SeAl tag
+        """
+        return parse_seal_metadata(self.decrypt(encrypted_tag))
@@ -0,0 +1,436 @@
+"""
+JPEG Steganography Module for SeAI
+Handles embedding and extracting encrypted tags in the quantized DCT
+coefficients of baseline JPEG images, without decoding to pixels
+"""
+
+import math
+import re
+from typing import Dict, Iterator, List, Tuple
+
+from steganography import ImageSteganography
+
+
+# JPEG marker codes
+EOI = 0xD9
+SOS = 0xDA
+DHT = 0xC4
+DRI = 0xDD
+BASELINE_FRAMES = {0xC0, 0xC1}
+UNSUPPORTED_FRAMES = {0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+RESTART_MARKER = re.compile(rb'(\xff[\xd0-\xd7])')
+SCAN_END_MARKER = re.compile(rb'\xff(?!\x00)(?![\xd0-\xd7])')
+
+
+class _BitReader:
+    """Read bits MSB-first from unstuffed JPEG entropy-coded data"""
+
+    def __init__(self, data: bytearray):
+        self.data = data
+        self.pos = 0
+
+    def read_bit(self) -> int:
+        byte_index = self.pos >> 3
+        if byte_index >= len(self.data):
+            raise ValueError("Unexpected end of JPEG scan data")
+        bit = (self.data[byte_index] >> (7 - (self.pos & 7))) & 1
+        self.pos += 1
+        return bit
+
+    def receive(self, length: int) -> int:
+        value = 0
+        for _ in range(length):
+            value = (value << 1) | self.read_bit()
+        return value
+
+    def decode(self, table: Dict[Tuple[int, int], int]) -> int:
+        code = 0
+        for length in range(1, 17):
+            code = (code << 1) | self.read_bit()
+            symbol = table.get((length, code))
+            if symbol is not None:
+                return symbol
+        raise ValueError("Invalid Huffman code in JPEG scan data")
+
+
+class JpegSteganography(ImageSteganography):
+    """
+    Handle embedding and extraction of data in baseline JPEG DCT coefficients
+
+    The tag bits replace the least significant bit of the magnitude of AC
+    coefficients with magnitude >= 2 in the first component of the first
+    scan. Such a change never moves a coefficient out of its Huffman size
+    category, so only the appended value bits of the entropy-coded stream
+    are rewritten in place and the rest of the file is copied unchanged.
+
+    Only the first MAX_SCAN_BYTES of unstuffed scan data carry the tag, so
+    the pure-Python Huffman decode done by embed, extract and capacity
+    checks is bounded regardless of image size or content.
+    """
+
+    MAX_SCAN_BYTES = 64 * 1024
+
+    def _parse_jpeg(self, data: bytes) -> dict:
+        """
+        Locate the frame header, Huffman tables and first scan of a JPEG
+
+        Args:
+            data: Raw JPEG file contents
+
+        Returns:
+            Dictionary describing the first scan
+
+        Raises:
+            ValueError: If the file is not a supported baseline JPEG
+        """
+        try:
+            return self._parse_segments(data)
+        except (IndexError, KeyError) as e:
+            raise ValueError(f"Corrupt JPEG: {str(e)}")
+
+    def _parse_segments(self, data: bytes) -> dict:
+        """
+        Walk the JPEG marker segments up to the first scan
+
+        Args:
+            data: Raw JPEG file contents
+
+        Returns:
+            Dictionary describing the first scan
+        """
+        if data[:2] != b'\xff\xd8':
+            raise ValueError("Not a JPEG file")
+
+        components = {}
+        huffman_tables = {}
+        restart_interval = 0
+        width = height = 0
+        offset = 2
+
+        while offset < len(data):
+            if data[offset] != 0xFF or offset + 1 >= len(data):
+                raise ValueError("Corrupt JPEG marker structure")
+            marker = data[offset + 1]
+            if marker == 0xFF:
+                offset += 1
+                continue
+            if marker == EOI:
+                break
+
+            length = int.from_bytes(data[offset + 2:offset + 4], 'big')
+            if length < 2 or offset + 2 + length > len(data):
+                raise ValueError("Truncated JPEG segment")
+            segment = data[offset + 4:offset + 2 + length]
+
+            if marker in UNSUPPORTED_FRAMES:
+                raise ValueError("Only baseline Huffman-coded JPEGs are supported")
+
+            if marker in BASELINE_FRAMES:
+                if len(segment) < 6 or len(segment) < 6 + segment[5] * 3:
+                    raise ValueError("Truncated JPEG frame header")
+                height = int.from_bytes(segment[1:3], 'big')
+                width = int.from_bytes(segment[3:5], 'big')
+                for i in range(segment[5]):
+                    component_id, sampling, _ = segment[6 + i * 3:9 + i * 3]
+                    components[component_id] = (sampling >> 4, sampling & 0x0F)
+
+            elif marker == DHT:
+                pos = 0
+                while pos < len(segment):
+                    table_class, table_id = segment[pos] >> 4, segment[pos] & 0x0F
+                    counts = segment[pos + 1:pos + 17]
+                    if len(counts) < 16:
+                        raise ValueError("Truncated JPEG Huffman table")
+                    symbols = segment[pos + 17:pos + 17 + sum(counts)]
+                    huffman_tables[(table_class, table_id)] = self._build_huffman_table(counts, symbols)
+                    pos += 17 + sum(counts)
+
+            elif marker == DRI:
+                restart_interval = int.from_bytes(segment[:2], 'big')
+
+            elif marker == SOS:
+                if not components:
+                    raise ValueError("Scan found before frame header")
+                scan_components = []
+                if len(segment) < 1 + segment[0] * 2:
+                    raise ValueError("Truncated JPEG scan header")
+                for i in range(segment[0]):
+                    component_id, tables = segment[1 + i * 2:3 + i * 2]
+                    if component_id not in components:
+                        raise ValueError("JPEG scan references an unknown component")
+                    scan_components.append((
+                        components[component_id],
+                        huffman_tables[(0, tables >> 4)],
+                        huffman_tables[(1, tables & 0x0F)],
+                    ))
+
+                scan_start = offset + 2 + length
+                end_match = SCAN_END_MARKER.search(data, scan_start)
+                scan_end = end_match.start() if end_match else len(data)
+
+                return {
+                    'width': width,
+                    'height': height,
+                    'max_h': max(h for h, _ in components.values()),
+                    'max_v': max(v for _, v in components.values()),
+                    'scan_components': scan_components,
+                    'restart_interval': restart_interval,
+                    'scan_start': scan_start,
+                    'scan_end': scan_end,
+                }
+
+            offset += 2 + length
+
+        raise ValueError("No scan data found in JPEG")
+
+    def _build_huffman_table(self, counts: bytes, symbols: bytes) -> Dict[Tuple[int, int], int]:
+        """
+        Build a canonical Huffman decoding table
+
+        Args:
+            counts: Number of codes of each length 1-16
+            symbols: Symbols in order of increasing code length
+
+        Returns:
+            Mapping of (code length, code) to symbol
+        """
+        table = {}
+        code = 0
+        index = 0
+        for length in range(1, 17):
+            for _ in range(counts[length - 1]):
+                table[(length, code)] = symbols[index]
+                code += 1
+                index += 1
+            code <<= 1
+        return table
+
+    def _mcu_layout(self, scan: dict) -> Tuple[int, List[int]]:
+        """
+        Work out the MCU count and blocks per MCU for each scan component
+
+        Args:
+            scan: Parsed scan description
+
+        Returns:
+            Tuple of (total MCUs, blocks per MCU for each scan component)
+        """
+        width, height = scan['width'], scan['height']
+        max_h, max_v = scan['max_h'], scan['max_v']
+        components = scan['scan_components']
+
+        if len(components) == 1:
+            (h, v), _, _ = components[0]
+            blocks_x = math.ceil(math.ceil(width * h / max_h) / 8)
+            blocks_y = math.ceil(math.ceil(height * v / max_v) / 8)
+            return blocks_x * blocks_y, [1]
+
+        mcus_x = math.ceil(width / (8 * max_h))
+        mcus_y = math.ceil(height / (8 * max_v))
+        return mcus_x * mcus_y, [h * v for (h, v), _, _ in components]
+
+    def _iter_slots(self, scan: dict, intervals: List[bytes],
+                    buffers: Dict[int, bytearray]) -> Iterator[Tuple[int, int, bool]]:
+        """
+        Walk the entropy-coded scan and yield usable coefficient positions
+
+        Stops at the first MCU starting past MAX_SCAN_BYTES of unstuffed
+        data; embedding never changes code lengths, so the window covers
+        the same coefficients before and after a tag is written.
+
+        Args:
+            scan: Parsed scan description
+            intervals: Scan data split on restart markers
+            buffers: Filled with the unstuffed data of each visited interval
+
+        Yields:
+            Tuple of (interval index, bit position of the coefficient LSB, negative)
+        """
+        total_mcus, blocks_per_mcu = self._mcu_layout(scan)
+        per_interval = scan['restart_interval'] or total_mcus
+        max_bits = self.MAX_SCAN_BYTES * 8
+        scan_bits = 0
+        mcu_index = 0
+
+        for interval_index in range(0, len(intervals), 2):
+            if mcu_index >= total_mcus:
+                return
+            buffer = bytearray(intervals[interval_index].replace(b'\xff\x00', b'\xff'))
+            buffers[interval_index] = buffer
+            reader = _BitReader(buffer)
+
+            for _ in range(min(per_interval, total_mcus - mcu_index)):
+                if scan_bits + reader.pos >= max_bits:
+                    return
+                for component_index, (_, dc_table, ac_table) in enumerate(scan['scan_components']):
+                    for _ in range(blocks_per_mcu[component_index]):
+                        reader.receive(reader.decode(dc_table))
+                        k = 1
+                        while k < 64:
+                            symbol = reader.decode(ac_table)
+                            run, size = symbol >> 4, symbol & 0x0F
+                            if size == 0:
+                                if run != 15:
+                                    break
+                                k += 16
+                                continue
+                            value = reader.receive(size)
+                            # Magnitudes of 2 and above keep their size category
+                            # when the LSB changes; negatives have a leading 0 bit
+                            if component_index == 0 and size > 1:
+                                yield interval_index, reader.pos - 1, not value >> (size - 1)
+                            k += run + 1
+                mcu_index += 1
+            scan_bits += len(buffer) * 8
+
+    def _read_bits(self, slots: Iterator[Tuple[int, int, bool]],
+                   buffers: Dict[int, bytearray], num_bits: int) -> str:
+        """
+        Read the embedded bits from the next coefficient slots
+
+        Args:
+            slots: Coefficient slot iterator
+            buffers: Unstuffed interval data
+            num_bits: Number of bits to read
+
+        Returns:
+            Extracted binary string
+        """
+        bits = []
+        for interval_index, pos, negative in slots:
+            bit = (buffers[interval_index][pos >> 3] >> (7 - (pos & 7))) & 1
+            bits.append(str(bit ^ negative))
+            if len(bits) == num_bits:
+                return ''.join(bits)
+        raise ValueError("JPEG does not contain enough coefficients")
+
+    def embed_tag(self, image_path: str, encrypted_tag: str, output_path: str) -> bool:
+        """
+        Embed encrypted SeAl tag into the DCT coefficients of a JPEG
+
+        Args:
+            image_path: Path to input JPEG
+            encrypted_tag: Encrypted tag to embed
+            output_path: Path to save output JPEG
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with open(image_path, 'rb') as f:
+                data = f.read()
+
+            scan = self._parse_jpeg(data)
+            intervals = RESTART_MARKER.split(data[scan['scan_start']:scan['scan_end']])
+
+            # Prepare data: length + MAGIC_HEADER + encrypted_tag
+            data_bits = self._string_to_bits(self.MAGIC_HEADER + encrypted_tag)
+            all_bits = format(len(data_bits), '032b') + data_bits
+
+            buffers = {}
+            slots = self._iter_slots(scan, intervals, buffers)
+            embedded = 0
+            for interval_index, pos, negative in slots:
+                bit = int(all_bits[embedded]) ^ negative
+                mask = 1 << (7 - (pos & 7))
+                buffer = buffers[interval_index]
+                buffer[pos >> 3] = (buffer[pos >> 3] & ~mask) | (mask if bit else 0)
+                embedded += 1
+                if embedded == len(all_bits):
+                    break
+
+            if embedded < len(all_bits):
+                raise ValueError(f"Image too small. Need {len(all_bits)} coefficients, have {embedded}")
+
+            for interval_index, buffer in buffers.items():
+                intervals[interval_index] = bytes(buffer).replace(b'\xff', b'\xff\x00')
+
+            with open(output_path, 'wb') as f:
+                f.write(data[:scan['scan_start']])
+                f.write(b''.join(intervals))
+                f.write(data[scan['scan_end']:])
+
+            return True
+
+        except Exception as e:
+            print(f"Error embedding tag: {str(e)}")
+            return False
+
+    def _extract_from_scan(self, data: bytes, scan: dict) -> Tuple[bool, str]:
+        """
+        Extract encrypted SeAl tag from the first scan of a parsed JPEG
+
+        Args:
+            data: Raw JPEG file contents
+            scan: Parsed scan description
+
+        Returns:
+            Tuple of (success, encrypted_tag)
+        """
+        try:
+            intervals = RESTART_MARKER.split(data[scan['scan_start']:scan['scan_end']])
+            buffers = {}
+            slots = self._iter_slots(scan, intervals, buffers)
+
+            # Extract length header, then check the magic header before reading the rest
+            data_length = int(self._read_bits(slots, buffers, self.LENGTH_BITS), 2)
+            header_bits = self.HEADER_LENGTH * 8
+            if data_length <= header_bits or data_length % 8:
+                return False, "No valid SeAl tag found"
+
+            if self._bits_to_string(self._read_bits(slots, buffers, header_bits)) != self.MAGIC_HEADER:
+                return False, "No valid SeAl tag found"
+
+            encrypted_tag = self._bits_to_string(self._read_bits(slots, buffers, data_length - header_bits))
+
+            return True, encrypted_tag
+
+        except Exception as e:
+            print(f"Error extracting tag: {str(e)}")
+            return False, f"Error: {str(e)}"
+
+    def iter_tags(self, image_path: str) -> Iterator[str]:
+        """
+        Extract candidate encrypted SeAl tags from the DCT coefficients of a JPEG
+
+        Falls back to per-frame pixel LSB extraction for files that are not
+        baseline JPEGs, such as sealed PNGs or animations that were renamed.
+
+        Args:
+            image_path: Path to image file
+
+        Yields:
+            Encrypted tag candidates, in the order they should be verified
+        """
+        try:
+            with open(image_path, 'rb') as f:
+                data = f.read()
+            scan = self._parse_jpeg(data)
+        except Exception:
+            yield from super().iter_tags(image_path)
+            return
+
+        success, encrypted_tag = self._extract_from_scan(data, scan)
+        if success:
+            yield encrypted_tag
+
+    def calculate_capacity(self, image_path: str) -> int:
+        """
+        Calculate how many characters can be hidden in a JPEG's coefficients
+
+        Args:
+            image_path: Path to image
+
+        Returns:
+            Maximum number of characters that can be hidden
+        """
+        try:
+            with open(image_path, 'rb') as f:
+                data = f.read()
+            scan = self._parse_jpeg(data)
+            intervals = RESTART_MARKER.split(data[scan['scan_start']:scan['scan_end']])
+            slots = sum(1 for _ in self._iter_slots(scan, intervals, {}))
+            return max(slots - self.LENGTH_BITS, 0) // 8
+        except:
+            return 0
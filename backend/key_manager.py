@@ -8,6 +8,8 @@ import string
 import hashlib
 import os
 from datetime import datetime
+from typing import Tuple
+from Crypto.PublicKey import ECC
 
 
 class KeyManager:
@@ -52,13 +54,25 @@ class KeyManager:
         return key.hex()
 
     @staticmethod
-    def save_key_to_file(key: str, filepath: str = '.env') -> bool:
+    def generate_signing_keypair() -> Tuple[str, str]:
         """
-        Save master key to .env file
+        Generate an Ed25519 key pair for signed SeAl tags
+
+        Returns:
+            Tuple of (signing_key, verify_key) as hex strings
+        """
+        key = ECC.generate(curve='ed25519')
+        return key.seed.hex(), key.public_key().export_key(format='raw').hex()
+
+    @staticmethod
+    def save_key_to_file(key: str, filepath: str = '.env', key_name: str = 'SEAL_MASTER_KEY') -> bool:
+        """
+        Save a key to .env file
 
         Args:
-            key: Master key to save
+            key: Key to save
             filepath: Path to .env file
+            key_name: Environment variable name for the key
 
         Returns:
             True if successful
@@ -71,18 +85,18 @@ class KeyManager:
                     for line in f:
                         line = line.strip()
                         if line and not line.startswith('#') and '=' in line:
-                            key_name, value = line.split('=', 1)
-                            existing_content[key_name.strip()] = value.strip()
+                            name, value = line.split('=', 1)
+                            existing_content[name.strip()] = value.strip()
 
-            # Update the master key
-            existing_content['SEAL_MASTER_KEY'] = key
+            # Update the key
+            existing_content[key_name] = key
 
             # Write back to file
             with open(filepath, 'w') as f:
                 f.write(f"# SeAI Configuration - Generated on {datetime.now().isoformat()}\n")
                 f.write(f"# IMPORTANT: Keep this file secure and never commit to version control\n\n")
-                for key_name, value in existing_content.items():
-                    f.write(f"{key_name}={value}\n")
+                for name, value in existing_content.items():
+                    f.write(f"{name}={value}\n")
 
             return True
         except Exception as e:
@@ -133,10 +147,11 @@ def main():
     print("Choose an option:")
     print("1. Generate a new random master key")
     print("2. Create key from passphrase")
-    print("3. Exit")
+    print("3. Generate an Ed25519 signing key pair")
+    print("4. Exit")
     print()
 
-    choice = input("Enter your choice (1-3): ").strip()
+    choice = input("Enter your choice (1-4): ").strip()
 
     if choice == '1':
         print("\nGenerating secure random master key...")
@@ -169,6 +184,23 @@ def main():
         print("\n⚠ Important: Save both the passphrase and salt to regenerate this key")
 
     elif choice == '3':
+        print("\nGenerating Ed25519 signing key pair...")
+        signing_key, verify_key = KeyManager.generate_signing_keypair()
+        print(f"\nSigning Key (private, sealing hosts only):")
+        print(f"{signing_key}")
+        print(f"\nVerify Key (public, safe to distribute):")
+        print(f"{verify_key}")
+
+        save = input("\nSave this key pair to .env file? (y/n): ").strip().lower()
+        if save == 'y':
+            if (KeyManager.save_key_to_file(signing_key, key_name='SEAL_SIGNING_KEY') and
+                    KeyManager.save_key_to_file(verify_key, key_name='SEAL_VERIFY_KEY')):
+                print("✓ Key pair saved successfully to .env file")
+                print("⚠ Set SEAL_TAG_MODE=ed25519 to sign new tags")
+            else:
+                print("✗ Failed to save key pair to file")
+
+    elif choice == '4':
         print("\nExiting...")
         return
 
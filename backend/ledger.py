@@ -0,0 +1,164 @@
+"""
+Seal Ledger Module for SeAI
+Keeps an append-only record of issued SeAl tags and their revocations
+"""
+
+import hashlib
+import math
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+
+class BloomFilter:
+    """Probabilistic set membership with no false negatives"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Initialize a Bloom filter sized for the expected number of items
+
+        Args:
+            capacity: Expected number of items
+            error_rate: Target false positive rate
+        """
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        """
+        Compute bit positions for an item using double hashing
+
+        Args:
+            item: Item to hash
+
+        Returns:
+            Generator of bit positions
+        """
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:], 'big') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str):
+        """Add an item to the filter"""
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class SealLedger:
+    """Record issued SeAl tags in SQLite and answer revocation checks"""
+
+    REFRESH_INTERVAL = 5  # Seconds between syncs of revocations made by other processes
+
+    def __init__(self, db_path: str, revocation_capacity: int = 1000000):
+        """
+        Initialize ledger and load existing revocations into the Bloom filter
+
+        Args:
+            db_path: Path to SQLite database file
+            revocation_capacity: Expected number of revoked tags
+        """
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS seals (
+                tag_id TEXT PRIMARY KEY,
+                issued_at TEXT NOT NULL,
+                original_filename TEXT,
+                output_filename TEXT
+            );
+            CREATE TABLE IF NOT EXISTS revocations (
+                tag_id TEXT PRIMARY KEY,
+                revoked_at TEXT NOT NULL,
+                reason TEXT
+            );
+        """)
+        self.conn.commit()
+
+        self.revoked_filter = BloomFilter(revocation_capacity)
+        self.last_revocation_rowid = 0
+        self.last_refresh = 0.0
+        self.refresh()
+
+    def refresh(self):
+        """Add revocations recorded since the last refresh to the Bloom filter"""
+        with self.lock:
+            rows = self.conn.execute(
+                'SELECT rowid, tag_id FROM revocations WHERE rowid > ? ORDER BY rowid',
+                (self.last_revocation_rowid,)
+            ).fetchall()
+            for rowid, tag_id in rows:
+                self.revoked_filter.add(tag_id)
+                self.last_revocation_rowid = rowid
+            self.last_refresh = time.monotonic()
+
+    def record_issue(self, tag_id: str, original_filename: str, output_filename: str,
+                     issued_at: str = None) -> None:
+        """
+        Append an issued SeAl tag to the ledger
+
+        Args:
+            tag_id: Unique tag ID embedded in the seal metadata
+            original_filename: Name of the uploaded file
+            output_filename: Name of the sealed output file
+            issued_at: ISO timestamp of issuance (defaults to now)
+        """
+        with self.lock:
+            self.conn.execute(
+                'INSERT INTO seals (tag_id, issued_at, original_filename, output_filename) VALUES (?, ?, ?, ?)',
+                (tag_id, issued_at or datetime.utcnow().isoformat(), original_filename, output_filename)
+            )
+            self.conn.commit()
+
+    def revoke(self, tag_id: str, reason: str = None) -> bool:
+        """
+        Revoke an issued SeAl tag
+
+        Args:
+            tag_id: Tag ID to revoke
+            reason: Optional reason for revocation
+
+        Returns:
+            True if the tag was issued and is now revoked, False if unknown
+        """
+        with self.lock:
+            if self.conn.execute('SELECT 1 FROM seals WHERE tag_id = ?', (tag_id,)).fetchone() is None:
+                return False
+            self.conn.execute(
+                'INSERT OR IGNORE INTO revocations (tag_id, revoked_at, reason) VALUES (?, ?, ?)',
+                (tag_id, datetime.utcnow().isoformat(), reason)
+            )
+            self.conn.commit()
+            self.revoked_filter.add(tag_id)
+            return True
+
+    def is_revoked(self, tag_id: str) -> bool:
+        """
+        Check whether a tag has been revoked
+
+        The Bloom filter answers most checks in memory; only possible
+        matches fall through to the indexed exact lookup.
+
+        Args:
+            tag_id: Tag ID to check
+
+        Returns:
+            True if the tag is revoked
+        """
+        if time.monotonic() - self.last_refresh > self.REFRESH_INTERVAL:
+            self.refresh()
+
+        if tag_id not in self.revoked_filter:
+            return False
+
+        with self.lock:
+            row = self.conn.execute('SELECT 1 FROM revocations WHERE tag_id = ?', (tag_id,)).fetchone()
+        return row is not None
@@ -0,0 +1,31 @@
+"""
+SeAl Tag Payload Helpers for SeAI
+Shared parsing of verified SeAl tag plaintext
+"""
+
+import ast
+
+SEAL_PREFIX = "SeAl:AI-GENERATED"
+
+
+def parse_seal_metadata(seal_data: str) -> dict:
+    """
+    Parse the metadata carried by verified SeAl tag plaintext
+
+    Args:
+        seal_data: Decrypted or signature-verified tag plaintext
+
+    Returns:
+        Metadata dictionary (empty if the tag carries none)
+
+    Raises:
+        ValueError: If the plaintext is not a SeAl tag
+    """
+    if not seal_data.startswith(SEAL_PREFIX):
+        raise ValueError("Not a SeAl tag")
+
+    try:
+        metadata = ast.literal_eval(seal_data[len(SEAL_PREFIX) + 1:])
+    except (ValueError, SyntaxError):
+        return {}
+    return metadata if isinstance(metadata, dict) else {}
@@ -0,0 +1,151 @@
+"""
+Ed25519 Signing Module for SeAI Tag
+Handles signing and public-key verification of the SeAl tag
+"""
+
+from Crypto.Signature import eddsa
+import base64
+
+from seal_tag import SEAL_PREFIX, parse_seal_metadata
+
+
+class SeAlSigner:
+    """Handle Ed25519 signing/verification for SeAl tags"""
+
+    # Prefix identifying signed tags; base64 AES tags never contain ':'
+    TAG_PREFIX = "ED25519:"
+    SIGNATURE_LENGTH = 64
+
+    def __init__(self, signing_key: str = None, verify_key: str = None):
+        """
+        Initialize signing handler with hex-encoded keys
+
+        Only the verify (public) key is needed on verification nodes; the
+        verify key is derived from the signing key when only that is given.
+
+        Args:
+            signing_key: Hex-encoded 32-byte Ed25519 private key seed
+            verify_key: Hex-encoded 32-byte Ed25519 public key
+
+        Raises:
+            ValueError: If no key is given or the keys do not form a pair
+        """
+        self.signing_key = None
+        if signing_key:
+            self.signing_key = eddsa.import_private_key(bytes.fromhex(signing_key))
+            derived_key = self.signing_key.public_key().export_key(format='raw').hex()
+            if not verify_key:
+                verify_key = derived_key
+            elif verify_key.lower() != derived_key:
+                raise ValueError("SEAL_VERIFY_KEY does not match SEAL_SIGNING_KEY")
+
+        if not verify_key:
+            raise ValueError("A signing key or verify key is required")
+
+        self.verifier = eddsa.new(eddsa.import_public_key(bytes.fromhex(verify_key)), 'rfc8032')
+
+    @classmethod
+    def is_signed_tag(cls, tag: str) -> bool:
+        """
+        Check whether a tag was produced by the signing mode
+
+        Args:
+            tag: Extracted tag
+
+        Returns:
+            True if the tag carries the Ed25519 prefix
+        """
+        return tag.startswith(cls.TAG_PREFIX)
+
+    def sign(self, data: str) -> str:
+        """
+        Sign data using Ed25519
+
+        Args:
+            data: Plain text data to sign
+
+        Returns:
+            Prefixed base64 signed data with format: signature:data
+        """
+        if self.signing_key is None:
+            raise ValueError("Signing key not configured")
+
+        payload = data.encode('utf-8')
+        signature = eddsa.new(self.signing_key, 'rfc8032').sign(payload)
+
+        return self.TAG_PREFIX + base64.b64encode(signature + payload).decode('utf-8')
+
+    def verify(self, signed_data: str) -> str:
+        """
+        Verify Ed25519 signed data with the public key
+
+        Args:
+            signed_data: Prefixed base64 signed data
+
+        Returns:
+            Verified plain text
+
+        Raises:
+            ValueError: If the signature is invalid or data is tampered with
+        """
+        try:
+            signed_bytes = base64.b64decode(signed_data[len(self.TAG_PREFIX):])
+
+            signature = signed_bytes[:self.SIGNATURE_LENGTH]
+            payload = signed_bytes[self.SIGNATURE_LENGTH:]
+
+            self.verifier.verify(payload, signature)
+
+            return payload.decode('utf-8')
+        except Exception as e:
+            raise ValueError(f"Signature verification failed: {str(e)}")
+
+    def generate_seal_tag(self, metadata: dict = None) -> str:
+        """
+        Generate a signed SeAl tag with optional metadata
+
+        The metadata is signed, not encrypted, so it is readable by anyone.
+
+        Args:
+            metadata: Optional dictionary with image metadata
+
+        Returns:
+            Signed SeAl tag
+        """
+        seal_data = SEAL_PREFIX
+        if metadata:
+            seal_data += f":{metadata}"
+
+        return self.sign(seal_data)
+
+    def verify_seal_tag(self, signed_tag: str) -> bool:
+        """
+        Verify if a signed tag is a valid SeAl tag
+
+        Args:
+            signed_tag: Signed SeAl tag to verify
+
+        Returns:
+            True if valid SeAl tag, False otherwise
+        """
+        if not self.is_signed_tag(signed_tag):
+            return False
+        try:
+            return self.verify(signed_tag).startswith(SEAL_PREFIX)
+        except ValueError:
+            return False
+
+    def get_seal_metadata(self, signed_tag: str) -> dict:
+        """
+        Validate a SeAl tag and return the metadata it carries
+
+        Args:
+            signed_tag: Signed SeAl tag to read
+
+        Returns:
+            Metadata dictionary (empty if the tag carries none)
+
+        Raises:
+            ValueError: If the tag is not a valid SeAl tag
+        """
+        return parse_seal_metadata(self.verify(signed_tag))
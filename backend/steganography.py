@@ -3,9 +3,14 @@ Steganography Module for SeAI
 Handles embedding and extracting encrypted tags in images using LSB technique
 """
 
-from PIL import Image
+from PIL import Image, TiffImagePlugin
 import numpy as np
-from typing import Tuple
+import io
+import struct
+import zlib
+from typing import BinaryIO, Iterator, List, Tuple
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
 
 
 class ImageSteganography:
@@ -16,9 +21,29 @@ class ImageSteganography:
     HEADER_LENGTH = 4
     LENGTH_BITS = 32  # Store data length in 32 bits
 
-    def __init__(self):
-        """Initialize steganography handler"""
-        pass
+    # Frame policies for multi-frame images (animations, multi-page TIFFs)
+    FRAME_POLICIES = ('first', 'all', 'nth')
+
+    # Lossless output format for each multi-frame input format. Frames are
+    # written one at a time, which Pillow's animation writers cannot do, so
+    # animations are sealed as APNG (GIF palettes would also destroy the LSBs)
+    MULTI_FRAME_FORMATS = {'GIF': 'PNG', 'PNG': 'PNG', 'WEBP': 'PNG', 'TIFF': 'TIFF'}
+
+    def __init__(self, frame_policy: str = 'first', frame_step: int = 1):
+        """
+        Initialize steganography handler
+
+        Args:
+            frame_policy: Frames to tag in multi-frame images: 'first', 'all' or 'nth'
+            frame_step: Tag every frame_step-th frame when frame_policy is 'nth'
+        """
+        if frame_policy not in self.FRAME_POLICIES:
+            raise ValueError(f"Invalid frame policy: {frame_policy}")
+        if frame_step < 1:
+            raise ValueError("Frame step must be at least 1")
+
+        self.frame_policy = frame_policy
+        self.frame_step = frame_step
 
     def _string_to_bits(self, data: str) -> str:
         """
@@ -83,10 +108,207 @@ class ImageSteganography:
         bits = ''.join(str(pixel & 1) for pixel in flat_pixels[:num_bits])
         return bits
 
+    def _frame_selected(self, index: int) -> bool:
+        """
+        Check whether a frame is tagged under the frame policy
+
+        Args:
+            index: Zero-based frame index
+
+        Returns:
+            True if the frame carries the tag
+        """
+        if self.frame_policy == 'all':
+            return True
+        if self.frame_policy == 'nth':
+            return index % self.frame_step == 0
+        return index == 0
+
+    def _is_multi_frame(self, img: Image.Image) -> bool:
+        """
+        Check whether an image is a supported multi-frame image
+
+        Args:
+            img: Opened image
+
+        Returns:
+            True for animations and multi-page TIFFs
+        """
+        return getattr(img, 'n_frames', 1) > 1 and img.format in self.MULTI_FRAME_FORMATS
+
+    def _iter_frames(self, img: Image.Image) -> Iterator[Tuple[int, Image.Image]]:
+        """
+        Stream the frames of an image one at a time as RGB
+
+        Args:
+            img: Opened image
+
+        Yields:
+            Tuple of (frame index, RGB frame)
+        """
+        for index in range(getattr(img, 'n_frames', 1)):
+            img.seek(index)
+            yield index, img.convert('RGB')
+
+    def _embed_in_frame(self, frame: Image.Image, all_bits: str) -> Image.Image:
+        """
+        Embed prepared bits into a single RGB frame
+
+        Args:
+            frame: RGB frame
+            all_bits: Length header and data bits
+
+        Returns:
+            New RGB frame carrying the bits
+        """
+        # Convert image to numpy array
+        pixels = np.array(frame)
+
+        # Check if image is large enough
+        total_pixels = pixels.size
+        if len(all_bits) > total_pixels:
+            raise ValueError(f"Image too small. Need {len(all_bits)} pixels, have {total_pixels}")
+
+        # Embed bits in pixels
+        modified_pixels = self._embed_bits_in_pixels(pixels, all_bits)
+
+        # Create new image from modified pixels
+        return Image.fromarray(modified_pixels.astype('uint8'), 'RGB')
+
+    def _extract_from_frame(self, frame: Image.Image) -> Tuple[bool, str]:
+        """
+        Extract encrypted SeAl tag from a single RGB frame
+
+        Args:
+            frame: RGB frame
+
+        Returns:
+            Tuple of (success, encrypted_tag)
+        """
+        # Convert to numpy array
+        pixels = np.array(frame)
+
+        # Extract length header (first 32 bits)
+        length_bits = self._extract_bits_from_pixels(pixels, self.LENGTH_BITS)
+        data_length = int(length_bits, 2)
+
+        # Validate data length
+        header_bits = self.HEADER_LENGTH * 8
+        if data_length <= header_bits or data_length > pixels.size - self.LENGTH_BITS:
+            return False, "No valid SeAl tag found"
+
+        # Check for magic header before reading the rest of the data
+        flat_pixels = pixels.flatten()
+        data_start = self.LENGTH_BITS + header_bits
+        header = ''.join(str(pixel & 1) for pixel in flat_pixels[self.LENGTH_BITS:data_start])
+        if self._bits_to_string(header) != self.MAGIC_HEADER:
+            return False, "No valid SeAl tag found"
+
+        # Extract data bits and return the encrypted tag
+        data_bits = ''.join(str(pixel & 1) for pixel in flat_pixels[data_start:self.LENGTH_BITS + data_length])
+        return True, self._bits_to_string(data_bits)
+
+    def _png_chunk(self, chunk_type: bytes, data: bytes) -> bytes:
+        """
+        Build a PNG chunk with length and CRC
+
+        Args:
+            chunk_type: Four-byte chunk type
+            data: Chunk payload
+
+        Returns:
+            Encoded chunk
+        """
+        return struct.pack('>I', len(data)) + chunk_type + data + struct.pack('>I', zlib.crc32(chunk_type + data))
+
+    def _encode_png_frame(self, frame: Image.Image) -> Tuple[bytes, List[bytes]]:
+        """
+        Encode a single frame as PNG and split out its header and image data
+
+        Args:
+            frame: RGB frame
+
+        Returns:
+            Tuple of (IHDR payload, list of IDAT payloads)
+        """
+        buffer = io.BytesIO()
+        frame.save(buffer, 'PNG', optimize=False)
+        png = buffer.getvalue()
+
+        header, image_data = b'', []
+        offset = len(PNG_SIGNATURE)
+        while offset < len(png):
+            length, chunk_type = struct.unpack('>I4s', png[offset:offset + 8])
+            data = png[offset + 8:offset + 8 + length]
+            if chunk_type == b'IHDR':
+                header = data
+            elif chunk_type == b'IDAT':
+                image_data.append(data)
+            offset += 12 + length
+        return header, image_data
+
+    def _write_apng(self, fp: BinaryIO, frames: Iterator[Tuple[Image.Image, int]],
+                    frame_count: int, loop: int) -> None:
+        """
+        Write an APNG one frame at a time
+
+        Each frame is a full-canvas fcTL + IDAT/fdAT sequence, so only the
+        current frame and its compressed data are held in memory.
+
+        Args:
+            fp: Output file opened for binary writing
+            frames: Iterator of (RGB frame, duration in ms)
+            frame_count: Number of frames the iterator yields
+            loop: Number of plays (0 = infinite)
+        """
+        sequence = 0
+        for index, (frame, duration) in enumerate(frames):
+            header, image_data = self._encode_png_frame(frame)
+
+            if index == 0:
+                fp.write(PNG_SIGNATURE)
+                fp.write(self._png_chunk(b'IHDR', header))
+                fp.write(self._png_chunk(b'acTL', struct.pack('>II', frame_count, loop)))
+
+            # Full-canvas frame: no offset, dispose none, blend source
+            fp.write(self._png_chunk(b'fcTL', struct.pack(
+                '>IIIIIHHBB', sequence, frame.width, frame.height, 0, 0,
+                min(int(round(duration or 0)), 0xFFFF), 1000, 0, 0
+            )))
+            sequence += 1
+
+            for data in image_data:
+                if index == 0:
+                    fp.write(self._png_chunk(b'IDAT', data))
+                else:
+                    fp.write(self._png_chunk(b'fdAT', struct.pack('>I', sequence) + data))
+                    sequence += 1
+
+        fp.write(self._png_chunk(b'IEND', b''))
+
+    def get_output_format(self, image_path: str) -> str:
+        """
+        Determine the output format for a sealed copy of an image
+
+        Args:
+            image_path: Path to input image
+
+        Returns:
+            Pillow format name: 'PNG' for single-frame images, otherwise a
+            lossless multi-frame format matching the input
+        """
+        with Image.open(image_path) as img:
+            if self._is_multi_frame(img):
+                return self.MULTI_FRAME_FORMATS[img.format]
+        return 'PNG'
+
     def embed_tag(self, image_path: str, encrypted_tag: str, output_path: str) -> bool:
         """
         Embed encrypted SeAl tag into an image
 
+        Multi-frame images are streamed frame by frame and tagged according
+        to the frame policy; use get_output_format() to name the output.
+
         Args:
             image_path: Path to input image
             encrypted_tag: Encrypted tag to embed
@@ -96,16 +318,6 @@ class ImageSteganography:
             True if successful, False otherwise
         """
         try:
-            # Open image
-            img = Image.open(image_path)
-
-            # Convert to RGB if necessary
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-
-            # Convert image to numpy array
-            pixels = np.array(img)
-
             # Prepare data: MAGIC_HEADER + length + encrypted_tag
             data_to_hide = self.MAGIC_HEADER + encrypted_tag
 
@@ -116,19 +328,28 @@ class ImageSteganography:
             length_bits = format(len(data_bits), '032b')
             all_bits = length_bits + data_bits
 
-            # Check if image is large enough
-            total_pixels = pixels.size
-            if len(all_bits) > total_pixels:
-                raise ValueError(f"Image too small. Need {len(all_bits)} pixels, have {total_pixels}")
-
-            # Embed bits in pixels
-            modified_pixels = self._embed_bits_in_pixels(pixels, all_bits)
-
-            # Create new image from modified pixels
-            new_img = Image.fromarray(modified_pixels.astype('uint8'), 'RGB')
-
-            # Save with maximum quality to minimize compression artifacts
-            new_img.save(output_path, 'PNG', optimize=False)
+            with Image.open(image_path) as img:
+                if not self._is_multi_frame(img):
+                    new_img = self._embed_in_frame(img.convert('RGB'), all_bits)
+
+                    # Save with maximum quality to minimize compression artifacts
+                    new_img.save(output_path, 'PNG', optimize=False)
+                    return True
+
+                frames = (
+                    (self._embed_in_frame(frame, all_bits) if self._frame_selected(index) else frame,
+                     img.info.get('duration', 0))
+                    for index, frame in self._iter_frames(img)
+                )
+
+                if self.MULTI_FRAME_FORMATS[img.format] == 'TIFF':
+                    with TiffImagePlugin.AppendingTiffWriter(output_path, new=True) as tiff:
+                        for frame, _ in frames:
+                            frame.save(tiff, 'TIFF', compression='tiff_lzw')
+                            tiff.newFrame()
+                else:
+                    with open(output_path, 'wb') as f:
+                        self._write_apng(f, frames, img.n_frames, img.info.get('loop', 0))
 
             return True
 
@@ -136,54 +357,46 @@ class ImageSteganography:
             print(f"Error embedding tag: {str(e)}")
             return False
 
-    def extract_tag(self, image_path: str) -> Tuple[bool, str]:
+    def iter_tags(self, image_path: str) -> Iterator[str]:
         """
-        Extract encrypted SeAl tag from an image
+        Extract candidate encrypted SeAl tags from an image, frame by frame
+
+        Every frame is checked, whatever frame policy the image was sealed
+        with, so callers can stop at the first tag that actually verifies
+        instead of trusting the first frame that merely looks tagged.
 
         Args:
             image_path: Path to image file
 
-        Returns:
-            Tuple of (success, encrypted_tag)
+        Yields:
+            Encrypted tag of each frame that holds one, in frame order
         """
         try:
-            # Open image
-            img = Image.open(image_path)
-
-            # Convert to RGB if necessary
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-
-            # Convert to numpy array
-            pixels = np.array(img)
-
-            # Extract length header (first 32 bits)
-            length_bits = self._extract_bits_from_pixels(pixels, self.LENGTH_BITS)
-            data_length = int(length_bits, 2)
-
-            # Validate data length
-            if data_length <= 0 or data_length > pixels.size - self.LENGTH_BITS:
-                return False, "No valid SeAl tag found"
+            with Image.open(image_path) as img:
+                for _, frame in self._iter_frames(img):
+                    success, encrypted_tag = self._extract_from_frame(frame)
+                    if success:
+                        yield encrypted_tag
 
-            # Extract data bits
-            flat_pixels = pixels.flatten()
-            data_bits = ''.join(str(pixel & 1) for pixel in flat_pixels[self.LENGTH_BITS:self.LENGTH_BITS + data_length])
+        except Exception as e:
+            print(f"Error extracting tag: {str(e)}")
 
-            # Convert bits to string
-            extracted_data = self._bits_to_string(data_bits)
+    def extract_tag(self, image_path: str) -> Tuple[bool, str]:
+        """
+        Extract encrypted SeAl tag from an image
 
-            # Check for magic header
-            if not extracted_data.startswith(self.MAGIC_HEADER):
-                return False, "No valid SeAl tag found"
+        Returns the tag of the first frame that holds one; use iter_tags()
+        to keep looking when that tag fails verification.
 
-            # Remove magic header and return encrypted tag
-            encrypted_tag = extracted_data[self.HEADER_LENGTH:]
+        Args:
+            image_path: Path to image file
 
+        Returns:
+            Tuple of (success, encrypted_tag)
+        """
+        for encrypted_tag in self.iter_tags(image_path):
             return True, encrypted_tag
-
-        except Exception as e:
-            print(f"Error extracting tag: {str(e)}")
-            return False, f"Error: {str(e)}"
+        return False, "No valid SeAl tag found"
 
     def calculate_capacity(self, image_path: str) -> int:
         """
@@ -116,7 +116,7 @@ const ImageVerifier = () => {
         >
           <div className="upload-icon">🔍</div>
           <p className="upload-text">Click or drag image here</p>
-          <p className="upload-hint">Supported formats: PNG, JPG, JPEG, BMP (Max 16MB)</p>
+          <p className="upload-hint">Supported formats: PNG, JPG, JPEG, BMP, GIF, WEBP, TIFF (Max 16MB)</p>
           <input
             ref={fileInputRef}
             type="file"
@@ -69,7 +69,7 @@ const InfoPanel = () => {
           <li><strong>Encryption Algorithm:</strong> AES-256-GCM (Advanced Encryption Standard)</li>
           <li><strong>Key Derivation:</strong> PBKDF2 with SHA-256</li>
           <li><strong>Steganography Method:</strong> LSB (Least Significant Bit) Technique</li>
-          <li><strong>Supported Formats:</strong> PNG, JPG, JPEG, BMP</li>
+          <li><strong>Supported Formats:</strong> PNG, JPG, JPEG, BMP, GIF, WEBP, TIFF (including animations and multi-page TIFFs)</li>
           <li><strong>Output Format:</strong> PNG (lossless compression)</li>
           <li><strong>Maximum File Size:</strong> 16 MB</li>
         </ul>